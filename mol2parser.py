@@ -5,15 +5,248 @@ and general information about a molecule.
 
 This tool accepts .mol2 files.
 
-There are no dependencies or requirements to install. Only Python requires.
+The only dependency is NumPy; atom records are stored as NumPy arrays. When
+Numba is installed, the numeric ATOM columns are parsed by a compiled kernel.
+
+Parsed results can be cached on disk by setting the environment variable
+ENS_SCORE_CACHE=1. Cache files are stored in ~/.cache/ens_score and are keyed by
+the file path, size, modification time, and cache format version.
 
 This file should be imported as a module for use. 
 
 """
 
-import re
-import operator
+import os
+import sys
+import json
+import mmap
+import hashlib
+import tempfile
 import collections
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+_TRIPOS_HEADER = b"@<TRIPOS>"
+_MOLECULE_HEADER = _TRIPOS_HEADER + b"MOLECULE"
+_ATOM_HEADER = _TRIPOS_HEADER + b"ATOM"
+_BOND_HEADER = _TRIPOS_HEADER + b"BOND"
+
+_INFO_KEYS = ("name", "general", "type", "charge", "status_bits", "comment")
+_GENERAL_KEYS = (
+    "atoms_count",
+    "bonds_count",
+    "substructure_counts",
+    "features_count",
+    "sets_count",
+)
+
+_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "ens_score")
+# Bump whenever parsing or the cache layout changes so stale files are not reused.
+_CACHE_VERSION = 1
+_STRING_FIELDS = ("atom_name", "atom_type", "subset_id", "subset_name")
+
+ParsedMol2 = collections.namedtuple(
+    "ParsedMol2", ["informations", "molecule_info", "bonding_info"]
+)
+
+
+def _parse_float(buf, start: int, end: int) -> float:
+
+    """
+    Parse a decimal number such as "-1.2340" or "1.5e-3" from buf[start:end].
+
+    Return NaN if the token is not a plain decimal number, so that the caller
+    can leave it to float().
+    """
+
+    pos = start
+    sign = 1.0
+    if buf[pos] == 45:
+        sign = -1.0
+        pos += 1
+    elif buf[pos] == 43:
+        pos += 1
+
+    value = 0.0
+    digits = 0
+    while pos < end and 48 <= buf[pos] <= 57:
+        value = value * 10.0 + (buf[pos] - 48)
+        digits += 1
+        pos += 1
+
+    if pos < end and buf[pos] == 46:
+        pos += 1
+        scale = 1.0
+        while pos < end and 48 <= buf[pos] <= 57:
+            value = value * 10.0 + (buf[pos] - 48)
+            scale *= 10.0
+            digits += 1
+            pos += 1
+        value /= scale
+    if digits == 0:
+        return np.nan
+
+    if pos < end and (buf[pos] == 69 or buf[pos] == 101):
+        pos += 1
+        exp_sign = 1
+        if pos < end and buf[pos] == 45:
+            exp_sign = -1
+            pos += 1
+        elif pos < end and buf[pos] == 43:
+            pos += 1
+        exponent = 0
+        exp_digits = 0
+        while pos < end and 48 <= buf[pos] <= 57:
+            exponent = exponent * 10 + (buf[pos] - 48)
+            exp_digits += 1
+            pos += 1
+        if exp_digits == 0:
+            return np.nan
+        value *= 10.0 ** (exp_sign * exponent)
+
+    if pos != end:
+        return np.nan
+    return sign * value
+
+
+def _parse_atom_block(buf, coords, charge, spans) -> tuple:
+
+    """
+    Fill coords, charge, and field offsets from the raw bytes of an ATOM section.
+
+    buf is a uint8 array starting at the section header. Blank lines are
+    skipped and reading stops after len(coords) records or at the next
+    @<TRIPOS> header. spans[row, field] receives the (start, end) offsets in
+    buf of the first nine fields of each record. Return the number of atom
+    records read (-1 if a record has fewer than nine fields or a numeric field
+    that is not a plain decimal number) and the offset where reading stopped.
+    """
+
+    size = buf.shape[0]
+    pos = 0
+    while pos < size and buf[pos] != 10:
+        pos += 1
+
+    row = 0
+    while pos < size and row < coords.shape[0]:
+        pos += 1
+        if pos < size and buf[pos] == 64:
+            break
+        field = 0
+        while pos < size and buf[pos] != 10:
+            if buf[pos] == 32 or 9 <= buf[pos] <= 13:
+                pos += 1
+                continue
+            start = pos
+            while pos < size and not (buf[pos] == 32 or 9 <= buf[pos] <= 13):
+                pos += 1
+            if field < 9:
+                spans[row, field, 0] = start
+                spans[row, field, 1] = pos
+            if 2 <= field <= 4 or field == 8:
+                value = _parse_float(buf, start, pos)
+                if np.isnan(value):
+                    return -1, pos
+                if field == 8:
+                    charge[row] = value
+                else:
+                    coords[row, field - 2] = value
+            field += 1
+        if field:
+            if field < 9:
+                return -1, pos
+            row += 1
+
+    return row, min(pos + 1, size)
+
+
+def _gather_field(buf: np.ndarray, spans: np.ndarray) -> np.ndarray:
+
+    """
+    Return the byte strings at the (start, end) offsets of buf as a unicode array.
+    """
+
+    lengths = spans[:, 1] - spans[:, 0]
+    width = max(int(lengths.max()), 1)
+    offsets = np.arange(width)
+    chars = buf[np.minimum(spans[:, :1] + offsets, buf.shape[0] - 1)]
+    chars[offsets >= lengths[:, None]] = 0
+    return chars.view("S%d" % width).ravel().astype("U")
+
+
+def _find_header(mol2_buf, header: bytes, start: int = 0) -> int:
+
+    """
+    Return the offset of header at the beginning of a line, or -1 if not found.
+    """
+
+    if start <= 0 and mol2_buf[: len(header)] == header:
+        return 0
+    pos = mol2_buf.find(b"\n" + header, max(start - 1, 0))
+    if pos == -1:
+        return pos
+    return pos + 1
+
+
+def _iter_lines(mol2_buf, start: int, end: int):
+
+    """
+    Yield the (line_start, line_end) offsets of the lines in mol2_buf[start:end].
+    """
+
+    while start < end:
+        stop = mol2_buf.find(b"\n", start, end)
+        if stop == -1:
+            stop = end
+        yield start, stop
+        start = stop + 1
+
+
+def _split_groups(values: np.ndarray, starts: np.ndarray) -> list:
+
+    """
+    Split values into views, one per group, given the start offset of each group.
+    """
+
+    bounds = starts.tolist() + [len(values)]
+    return [values[start:stop] for start, stop in zip(bounds, bounds[1:])]
+
+
+def _pack_groups(groups: dict) -> tuple:
+
+    """
+    Flatten a dictionary of arrays into keys, concatenated values, and sizes.
+    """
+
+    keys = list(groups)
+    sizes = np.array([len(groups[key]) for key in keys], dtype=np.intp)
+    if keys:
+        values = np.concatenate([groups[key] for key in keys])
+    else:
+        values = np.empty(0)
+    if values.dtype == object:
+        values = values.astype(str)
+    return np.array(keys), values, sizes
+
+
+def _unpack_groups(keys: np.ndarray, values: np.ndarray, sizes: np.ndarray) -> dict:
+
+    """
+    Rebuild the dictionary flattened by _pack_groups.
+    """
+
+    return dict(zip(keys.tolist(), _split_groups(values, np.cumsum(sizes) - sizes)))
+
+
+if njit is not None:
+    _parse_float = njit(cache=True)(_parse_float)
+    _parse_atom_block = njit(cache=True)(_parse_atom_block)
 
 
 class Mol2Parser:
@@ -29,14 +262,29 @@ class Mol2Parser:
         
     Methods
     -------
-    _section1_extract(pattern=r"(@<TRIPOS>MOLECULE).*(@<TRIPOS>ATOM)")
-        Extract information from mol2 files.
+    _section1_extract(mol2_buf)
+        Extract information from the MOLECULE section.
+        
+    _section2_extract(mol2_buf)
+        Extract information from the ATOM section.
+        
+    _column_extract(mol2_buf, atoms_count)
+        Extract information from the ATOM section with the compiled kernel.
+        
+    _section3_extract(mol2_buf)
+        Extract information from the BOND section.
+        
+    _build_index()
+        Group atom rows by element symbol.
+        
+    _cache_path()
+        Return the cache file of the mol2 file.
         
-    _section2_extract(pattern=r"(@<TRIPOS>ATOM).*(@<TRIPOS>BOND)")
-        Extract information from mol2 files.
+    _save_cache(cache_path)
+        Store the parsed information in a cache file.
         
-    _section3_extract(pattern=r"(@<TRIPOS>BOND).*")
-        Extract information from mol2 files.
+    _load_cache(cache_path)
+        Restore the parsed information from a cache file.
         
     get_information(kind="name")
         Print general information about molecule
@@ -50,6 +298,9 @@ class Mol2Parser:
     parse()
     
         Start parsing the mol2 file.
+        
+    parse_and_return()
+        Parse the mol2 file and return the extracted information.
     """
 
     def __init__(self, mol2_file: str) -> None:
@@ -63,100 +314,107 @@ class Mol2Parser:
 
         self.mol2_file = mol2_file
 
-    def _section1_extract(
-        self, mol2_str: str, pattern: str = r"(@<TRIPOS>MOLECULE).*(@<TRIPOS>ATOM)"
-    ) -> dict:
+    def _section1_extract(self, mol2_buf: mmap.mmap) -> dict:
 
         """
-        Extract a selection of string from mol2 files (private method). 
+        Extract general information from the MOLECULE section (private method). 
         
         Parameters
         ----------
-        mol2_str: str
-            Content of the opened mol2 file as a string.
-            
-        pattern: str
-            Pattern to match to mol2_str (default is "(@<TRIPOS>MOLECULE).*(@<TRIPOS>ATOM)")
+        mol2_buf: mmap.mmap
+            Memory map of the opened mol2 file.
         
         Return
         ------
         
         informations: dict
             Return a dictionary of all extracted information
+            
+        Raises
+        ------
+        ValueError
+            If the MOLECULE or ATOM section is missing.
+            
         """
 
-        matches = re.finditer(pattern, mol2_str, re.MULTILINE | re.DOTALL)
-        match_text = next(matches).group()
-        lines = match_text.splitlines()
+        start = _find_header(mol2_buf, _MOLECULE_HEADER)
+        end = _find_header(mol2_buf, _ATOM_HEADER, start)
+        if start == -1 or end == -1:
+            raise ValueError("Missing MOLECULE or ATOM section")
+        self.section_offsets = {"molecule": (start, end)}
+
+        lines = mol2_buf[start:end].decode().splitlines()
 
-        info_list = ["name", "general", "type", "charge", "status_bits", "comment"]
-        self.informations = dict(zip(info_list, lines[1:-1]))
+        self.informations = dict(zip(_INFO_KEYS, lines[1:]))
         self.informations["general"] = dict(
-            zip(
-                [
-                    "atoms_count",
-                    "bonds_count",
-                    "substructure_counts",
-                    "features_count",
-                    "sets_count",
-                ],
-                self.informations["general"].split(),
-            )
+            zip(_GENERAL_KEYS, self.informations["general"].split())
         )
 
         return self.informations
 
-    def _section2_extract(
-        self, mol2_str: str, pattern: str = r"(@<TRIPOS>ATOM).*(@<TRIPOS>BOND)"
-    ) -> dict:
+    def _section2_extract(self, mol2_buf: mmap.mmap) -> dict:
 
         """
-        Extract a selection of string from mol2 files (private method). 
+        Extract atom records from the ATOM section (private method). 
         
         Parameters
         ----------
-        mol2_str: str
-            Content of the opened mol2 file as a string.
-            
-        pattern: str
-            Pattern to match to mol2_str (default is "(@<TRIPOS>ATOM).*(@<TRIPOS>BOND)")
+        mol2_buf: mmap.mmap
+            Memory map of the opened mol2 file.
         
         Return
         ------
         
-        informations: dict
+        molecule_info: dict
             Return a dictionary of all extracted information
         """
 
-        matches = re.finditer(pattern, mol2_str, re.MULTILINE | re.DOTALL)
-        match_text = next(matches).group()
-        lines = match_text.splitlines()
+        start = self.section_offsets["molecule"][1]
+        atoms_count = int(self.informations["general"]["atoms_count"])
 
-        self.index_info = collections.defaultdict(list)
-        atom_name_info = {}
-        coords_info = {}
-        atom_type_info = {}
-        subset_id_info = {}
-        subset_name_info = {}
-        charge_info = {}
+        self.index_info = None
+        self.molecule_info = None
+        if njit is not None and atoms_count:
+            self.molecule_info = self._column_extract(mol2_buf, atoms_count)
+        if self.molecule_info is not None:
+            return self.molecule_info
 
-        for line in lines[1:-1]:
+        end = mol2_buf.find(b"\n", start) + 1
+        if end == 0:
+            end = len(mol2_buf)
+        lines = _iter_lines(mol2_buf, end, len(mol2_buf))
 
-            line = line.split()
-            index = line[0]
+        atom_name_info = np.empty(atoms_count, dtype=object)
+        coords_info = np.empty((atoms_count, 3), dtype=np.float32)
+        atom_type_info = np.empty(atoms_count, dtype=object)
+        subset_id_info = np.empty(atoms_count, dtype=object)
+        subset_name_info = np.empty(atoms_count, dtype=object)
+        charge_info = np.empty(atoms_count, dtype=np.float32)
+
+        index = 0
+        for line_start, line_end in lines:
+
+            if index == atoms_count:
+                break
+            line = mol2_buf[line_start:line_end].split()
+            if not line:
+                continue
+            if line[0].startswith(_TRIPOS_HEADER):
+                break
 
-            self.index_info[line[1][0]].append(index)
-            atom_name_info[index] = line[1]
-            coords_info[index] = line[2:5]
-            atom_type_info[index] = line[5]
-            subset_id_info[index] = line[6]
-            subset_name_info[index] = line[7]
-            charge_info[index] = line[8]
+            atom_name_info[index] = line[1].decode()
+            atom_type_info[index] = sys.intern(line[5].decode())
+            subset_id_info[index] = line[6].decode()
+            subset_name_info[index] = line[7].decode()
+            coords_info[index] = (float(line[2]), float(line[3]), float(line[4]))
+            charge_info[index] = float(line[8])
+            index += 1
+            end = line_end + 1
 
+        self.section_offsets["atom"] = (start, end)
         self.molecule_info = dict(
             zip(
                 [
-                    "element",
                     "atom_name",
                     "coords",
                     "atom_type",
@@ -165,7 +423,80 @@ class Mol2Parser:
                     "charge",
                 ],
                 [
-                    self.index_info,
+                    atom_name_info[:index],
+                    coords_info[:index],
+                    atom_type_info[:index],
+                    subset_id_info[:index],
+                    subset_name_info[:index],
+                    charge_info[:index],
+                ],
+            )
+        )
+        return self.molecule_info
+
+    def _column_extract(self, mol2_buf: mmap.mmap, atoms_count: int) -> dict:
+
+        """
+        Extract atom records with the compiled ATOM kernel (private method). 
+        
+        The kernel parses the numeric fields and records the byte offsets of
+        every field, so the string columns are sliced out of the section at once
+        instead of splitting each record into a list.
+        
+        Parameters
+        ----------
+        mol2_buf: mmap.mmap
+            Memory map of the opened mol2 file.
+            
+        atoms_count: int
+            Number of atom records in the ATOM section.
+        
+        Return
+        ------
+        
+        molecule_info: dict
+            Return a dictionary of all extracted information, or None if a
+            record could not be parsed by the kernel
+        """
+
+        start = self.section_offsets["molecule"][1]
+        section = np.frombuffer(mol2_buf, dtype=np.uint8, offset=start)
+
+        coords_info = np.empty((atoms_count, 3), dtype=np.float32)
+        charge_info = np.empty(atoms_count, dtype=np.float32)
+        spans = np.empty((atoms_count, 9, 2), dtype=np.intp)
+
+        try:
+            rows, end = _parse_atom_block(section, coords_info, charge_info, spans)
+            if rows != atoms_count:
+                return None
+            columns = [
+                _gather_field(section, spans[:, field]).tolist()
+                for field in (1, 5, 6, 7)
+            ]
+        except UnicodeDecodeError:
+            return None
+        finally:
+            # Release the buffer export so the memory map can be closed.
+            del section
+
+        self.section_offsets["atom"] = (start, start + end)
+        columns[1] = [sys.intern(atom_type) for atom_type in columns[1]]
+        atom_name_info, atom_type_info, subset_id_info, subset_name_info = (
+            np.array(column, dtype=object) for column in columns
+        )
+
+        return dict(
+            zip(
+                [
+                    "atom_name",
+                    "coords",
+                    "atom_type",
+                    "subset_id",
+                    "subset_name",
+                    "charge",
+                ],
+                [
                     atom_name_info,
                     coords_info,
                     atom_type_info,
@@ -175,47 +506,193 @@ class Mol2Parser:
                 ],
             )
         )
-        return self.molecule_info
 
-    def _section3_extract(
-        self, mol2_str: str, pattern: str = r"(@<TRIPOS>BOND).*"
-    ) -> dict:
+    def _section3_extract(self, mol2_buf: mmap.mmap) -> dict:
 
         """
-        Extract a selection of string from mol2 files (private method). 
+        Extract bond records from the BOND section (private method). 
         
         Parameters
         ----------
-        mol2_str: str
-            Content of the opened mol2 file as a string.
-            
-        pattern: str
-            Pattern to match to mol2_str (default is "(@<TRIPOS>BOND).*")
+        mol2_buf: mmap.mmap
+            Memory map of the opened mol2 file.
         
         Return
         ------
         
-        informations: dict
+        bonding_info: dict
             Return a dictionary of all extracted information
         """
 
-        matches = re.finditer(pattern, mol2_str, re.MULTILINE | re.DOTALL)
-        match_text = next(matches).group()
-        lines = match_text.splitlines()
-
-        atom_bond_info = collections.defaultdict(list)
-        bond_type_info = collections.defaultdict(list)
+        start = _find_header(mol2_buf, _BOND_HEADER, self.section_offsets["atom"][1])
+        end = start
+        lines = iter(())
+        if start != -1:
+            body = mol2_buf.find(b"\n", start) + 1
+            if body == 0:
+                body = len(mol2_buf)
+            lines = _iter_lines(mol2_buf, body, len(mol2_buf))
+        # num_bonds is optional in the counts line; without it, read bonds up
+        # to the next section and grow the arrays as needed.
+        bonds_count = self.informations["general"].get("bonds_count")
+        if bonds_count is not None:
+            bonds_count = int(bonds_count)
+        capacity = 64 if bonds_count is None else bonds_count
+
+        bonds_from = np.empty(capacity, dtype=np.int32)
+        bonds_to = np.empty(capacity, dtype=np.int32)
+        bonds_type = np.empty(capacity, dtype=object)
+
+        index = 0
+        for line_start, line_end in lines:
+
+            if index == bonds_count:
+                break
+            line = mol2_buf[line_start:line_end].split()
+            if not line:
+                continue
+            if line[0].startswith(_TRIPOS_HEADER):
+                break
+            if index == capacity:
+                capacity *= 2
+                bonds_from, bonds_to, bonds_type = (
+                    np.concatenate([values, np.empty_like(values)])
+                    for values in (bonds_from, bonds_to, bonds_type)
+                )
+            bonds_from[index] = int(line[1])
+            bonds_to[index] = int(line[2])
+            bonds_type[index] = line[3].decode()
+            index += 1
+            end = line_end + 1
+
+        self.section_offsets["bond"] = (start, end)
+
+        order = np.argsort(bonds_from[:index], kind="stable")
+        origins, starts = np.unique(bonds_from[order], return_index=True)
+        atom_bond_info = dict(
+            zip(origins.tolist(), _split_groups(bonds_to[order], starts))
+        )
+        bond_type_info = dict(
+            zip(origins.tolist(), _split_groups(bonds_type[order], starts))
+        )
         self.bonding_info = {"atoms_bond": atom_bond_info, "bonds_type": bond_type_info}
 
-        for line in lines[1:]:
+        return self.bonding_info
+
+    def _build_index(self) -> dict:
 
-            line = line.split()
-            if line[0] == "@<TRIPOS>SUBSTRUCTURE":
-                break
-            atom_bond_info[line[1]].append(line[2])
-            bond_type_info[line[1]].append(line[3])
+        """
+        Group atom rows by element symbol (private method). 
+        
+        The element symbol is the first character of the atom name. The index is
+        built on the first call to get_molecule rather than during parsing.
+        
+        Return
+        ------
+        
+        index_info: dict
+            Return a dictionary of row indices for each element symbol
+        """
 
-        return self.bonding_info
+        elements = self.molecule_info["atom_name"].astype("U1")
+        order = np.argsort(elements, kind="stable")
+        symbols, starts = np.unique(elements[order], return_index=True)
+        self.index_info = dict(
+            zip(map(sys.intern, symbols.tolist()), _split_groups(order, starts))
+        )
+        self.molecule_info["element"] = self.index_info
+
+        return self.index_info
+
+    def _cache_path(self) -> str:
+
+        """
+        Return the cache file of the mol2 file (private method). 
+        
+        Return
+        ------
+        
+        cache_path: str
+            Path of the .npz cache file for the current version of mol2_file.
+        """
+
+        stat = os.stat(self.mol2_file)
+        key = "{}:{}:{}:{}".format(
+            _CACHE_VERSION,
+            os.path.abspath(self.mol2_file),
+            stat.st_size,
+            stat.st_mtime_ns,
+        )
+        digest = hashlib.blake2b(key.encode(), digest_size=20).hexdigest()
+        return os.path.join(_CACHE_DIR, digest + ".npz")
+
+    def _save_cache(self, cache_path: str) -> None:
+
+        """
+        Store the parsed information in a .npz cache file (private method). 
+        
+        Parameters
+        ----------
+        cache_path: str
+            Path of the cache file.
+        """
+
+        arrays = {"informations": np.array(json.dumps(self.informations))}
+        for kind in ("coords", "charge"):
+            arrays[kind] = self.molecule_info[kind]
+        for kind in _STRING_FIELDS:
+            arrays[kind] = self.molecule_info[kind].astype(str)
+        for kind, group in self.bonding_info.items():
+            keys, values, sizes = _pack_groups(group)
+            arrays[kind + "_keys"] = keys
+            arrays[kind + "_values"] = values
+            arrays[kind + "_sizes"] = sizes
+
+        os.makedirs(_CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=_CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as file:
+                np.savez(file, **arrays)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    def _load_cache(self, cache_path: str) -> None:
+
+        """
+        Restore the parsed information from a .npz cache file (private method). 
+        
+        Parameters
+        ----------
+        cache_path: str
+            Path of the cache file.
+        """
+
+        with np.load(cache_path) as arrays:
+
+            groups = {
+                kind: _unpack_groups(
+                    arrays[kind + "_keys"],
+                    arrays[kind + "_values"],
+                    arrays[kind + "_sizes"],
+                )
+                for kind in ("atoms_bond", "bonds_type")
+            }
+            for key, values in groups["bonds_type"].items():
+                groups["bonds_type"][key] = values.astype(object)
+
+            self.informations = json.loads(arrays["informations"].item())
+            self.index_info = None
+            self.molecule_info = {}
+            for kind in _STRING_FIELDS:
+                self.molecule_info[kind] = arrays[kind].astype(object)
+            for kind in ("coords", "charge"):
+                self.molecule_info[kind] = arrays[kind]
+            self.bonding_info = {
+                "atoms_bond": groups["atoms_bond"],
+                "bonds_type": groups["bonds_type"],
+            }
 
     def get_information(self, kind: str = "name") -> str:
 
@@ -254,7 +731,7 @@ class Mol2Parser:
             variable = self.informations.get(kind, "Missed or not mentioned Value")
             return variable
 
-    def get_molecule(self, element: str, kind: str = "atom_name") -> dict:
+    def get_molecule(self, element: str, kind: str = "atom_name") -> np.ndarray:
 
         """
         Return chemical and structural information about the molecule: atom name,
@@ -272,8 +749,9 @@ class Mol2Parser:
             
         Return
         ------
-        variable: dict
-            The value of the selected kind for the desired element in the dictionary.
+        variable: np.ndarray
+            The values of the selected kind for the desired element, one row per atom.
+            Empty if the element is not present in the molecule.
             
         Raises
         ------
@@ -297,8 +775,10 @@ class Mol2Parser:
 
         else:
 
-            f = operator.itemgetter(*self.index_info[element])
-            variable = list(f(self.molecule_info[kind]))
+            if self.index_info is None:
+                self._build_index()
+            rows = self.index_info.get(element, np.empty(0, dtype=np.intp))
+            variable = self.molecule_info[kind][rows]
             return variable
 
     def get_bond(self, kind: str = "atoms_bond") -> dict:
@@ -317,7 +797,8 @@ class Mol2Parser:
         Return
         ------
         variable: dict
-            The value of the selected kind in the dictionary.
+            The value of the selected kind, keyed by the origin atom id. Each
+            value is an array with one entry per bond of that atom.
             
         Raises
         ------
@@ -343,9 +824,77 @@ class Mol2Parser:
         
         """
 
-        with open(self.mol2_file) as file:
-            self.mol2_str = file.read()
+        use_cache = os.environ.get("ENS_SCORE_CACHE") == "1"
+        if use_cache:
+            cache_path = self._cache_path()
+            if os.path.exists(cache_path):
+                self._load_cache(cache_path)
+                return
+
+        with open(self.mol2_file, "rb") as file:
+
+            mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+            try:
+
+                self._section1_extract(mm)
+                self._section2_extract(mm)
+                self._section3_extract(mm)
+
+            finally:
+                mm.close()
+
+        if use_cache:
+            # The cache is optional; a failed write must not fail the parse.
+            try:
+                self._save_cache(cache_path)
+            except OSError:
+                pass
+
+    def parse_and_return(self) -> ParsedMol2:
+
+        """
+        Parse the mol2 file and return the extracted information.
+        
+        Return
+        ------
+        parsed: ParsedMol2
+            Named tuple of informations, molecule_info, and bonding_info.
+            
+        """
+
+        self.parse()
+        return ParsedMol2(self.informations, self.molecule_info, self.bonding_info)
+
+
+def _parse_one(mol2_file: str) -> tuple:
+
+    """
+    Parse a single mol2 file in a worker process.
+    """
+
+    return mol2_file, Mol2Parser(mol2_file).parse_and_return()
+
+
+def parse_many(mol2_files: list, max_workers: int = None) -> list:
+
+    """
+    Parse several mol2 files in parallel worker processes.
+    
+    Parameters
+    ----------
+    mol2_files: list
+        Names of the mol2 files as strings.
+        
+    max_workers: int
+        Number of worker processes (default is None, the number of CPUs).
+        
+    Return
+    ------
+    parsed: list
+        List of (mol2_file, ParsedMol2) tuples in the order of mol2_files.
+        
+    """
 
-        self.information = self._section1_extract(self.mol2_str)
-        self.molecule_info = self._section2_extract(self.mol2_str)
-        self.bonding_info = self._section3_extract(self.mol2_str)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(_parse_one, mol2_files))